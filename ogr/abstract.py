@@ -30,15 +30,6 @@ from ogr.exceptions import (
 )
 from ogr.parsing import parse_git_repo
 
-try:
-    from functools import cached_property as _cached_property
-except ImportError:
-    from functools import lru_cache
-
-    def _cached_property(func):  # type: ignore
-        return property(lru_cache()(func))
-
-
 AnyComment = TypeVar("AnyComment", bound="Comment")
 
 
@@ -132,7 +123,7 @@ class CatchCommonErrors(type):
         - network errors
     """
 
-    def __new__(cls, name, bases, namespace):
+    def __new__(cls, name, bases, namespace, **kwargs):
         for key, value in namespace.items():
             # There is an anticipated change in behaviour in Python 3.10
             # for static/class methods. From Python 3.10 they will be callable.
@@ -148,10 +139,49 @@ class CatchCommonErrors(type):
                 namespace[key] = classmethod(catch_common_exceptions(value.__func__))
             elif callable(namespace[key]):
                 namespace[key] = catch_common_exceptions(namespace[key])
-        return super().__new__(cls, name, bases, namespace)
+        return super().__new__(cls, name, bases, namespace, **kwargs)
 
 
 class OgrAbstractClass(metaclass=CatchCommonErrors):
+    """
+    Attributes:
+        _required (Tuple[str, ...]): Names of the attributes that have to be
+            overridden by the concrete implementations. Checked once when the
+            subclass is defined, instead of failing on the first access.
+    """
+
+    _required: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, abstract: bool = False, **kwargs: Any) -> None:
+        """
+        Validates that the concrete subclass overrides all required attributes.
+
+        Args:
+            abstract: Marks the subclass as abstract, i.e. it does not need to
+                override the required attributes, e.g. `BaseIssue`.
+
+                Defaults to `False`.
+
+        Raises:
+            TypeError, if the concrete subclass does not override any of the
+            required attributes.
+        """
+        super().__init_subclass__(**kwargs)
+        if abstract or "_required" in cls.__dict__:
+            return
+
+        owner = next(kls for kls in cls.__mro__ if "_required" in kls.__dict__)
+        missing = [
+            name
+            for name in cls._required
+            if getattr(cls, name, None) is getattr(owner, name, None)
+        ]
+        if missing:
+            raise TypeError(
+                f"{cls.__name__} does not override required attributes of "
+                f"{owner.__name__}: {', '.join(missing)}",
+            )
+
     def __repr__(self) -> str:
         return f"<{self!s}>"
 
@@ -287,6 +317,17 @@ class Issue(OgrAbstractClass):
         project (GitProject): Project of the issue.
     """
 
+    _required = (
+        "title",
+        "id",
+        "status",
+        "url",
+        "description",
+        "author",
+        "created",
+        "labels",
+    )
+
     def __init__(self, raw_issue: Any, project: "GitProject") -> None:
         self._raw_issue = raw_issue
         self.project = project
@@ -503,6 +544,8 @@ class Issue(OgrAbstractClass):
         """
         Add labels to the issue.
 
+        Implementations are expected to add all labels in a single request.
+
         Args:
             *labels: Labels to be added.
         """
@@ -512,6 +555,8 @@ class Issue(OgrAbstractClass):
         """
         Assign users to an issue.
 
+        Implementations are expected to assign all users in a single request.
+
         Args:
             *assignees: List of logins of the assignees.
         """
@@ -566,6 +611,18 @@ class PullRequest(OgrAbstractClass):
         project (GitProject): Project of the pull request.
     """
 
+    _required = (
+        "title",
+        "id",
+        "status",
+        "url",
+        "description",
+        "author",
+        "source_branch",
+        "target_branch",
+        "created",
+    )
+
     def __init__(self, raw_pr: Any, project: "GitProject") -> None:
         self._raw_pr = raw_pr
         self._target_project = project
@@ -891,6 +948,8 @@ class PullRequest(OgrAbstractClass):
         """
         Add labels to the pull request.
 
+        Implementations are expected to add all labels in a single request.
+
         Args:
             *labels: Labels to be added.
         """
@@ -1107,6 +1166,15 @@ class Release(OgrAbstractClass):
         project (GitProject): Project on which the release is created.
     """
 
+    _required = (
+        "title",
+        "body",
+        "tag_name",
+        "url",
+        "created_at",
+        "tarball_url",
+    )
+
     def __init__(
         self,
         raw_release: Any,
@@ -1297,7 +1365,7 @@ class GitService(OgrAbstractClass):
             raise OgrException(f"Failed to find repository for url: {url}")
         return self.get_project(repo=repo_url.repo, namespace=repo_url.namespace)
 
-    @_cached_property
+    @functools.cached_property
     def hostname(self) -> Optional[str]:
         """Hostname of the service."""
         raise NotImplementedError
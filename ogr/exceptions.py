@@ -48,12 +48,8 @@ class GithubAPIException(APIException):
 
     @property
     def response_code(self):
-        if self.__cause__ is None or not isinstance(
-            self.__cause__,
-            github.GithubException,
-        ):
-            return None
-        return self.__cause__.status
+        cause = self.__cause__
+        return cause.status if isinstance(cause, github.GithubException) else None
 
 
 class GitlabAPIException(APIException):
@@ -61,9 +57,8 @@ class GitlabAPIException(APIException):
 
     @property
     def response_code(self):
-        if self.__cause__ is None or not isinstance(self.__cause__, gitlab.GitlabError):
-            return None
-        return self.__cause__.response_code
+        cause = self.__cause__
+        return cause.response_code if isinstance(cause, gitlab.GitlabError) else None
 
 
 class OperationNotSupported(OgrException):
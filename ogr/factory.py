@@ -7,12 +7,36 @@ from typing import Optional
 
 from ogr.abstract import GitProject, GitService
 from ogr.exceptions import OgrException
-from ogr.parsing import parse_git_repo
+from ogr.parsing import parse_git_repo, parse_git_repo_cached
 
 _SERVICE_MAPPING: dict[str, type[GitService]] = {}
+# hostnames of the registered services, kept in the order of registration
+_SERVICE_HOSTNAMES: dict[str, type[GitService]] = {}
 
 
-def use_for_service(service: str, _func=None):
+def _find_hostname(hostname: str, hostnames: Iterable[str]) -> Optional[str]:
+    """
+    Find the first of the hostnames (in the given order) that is contained in
+    the given hostname, e.g. "gitlab" matches any hostname containing the word.
+    """
+    return next((name for name in hostnames if name in hostname), None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_registered_service_class(hostname: str) -> Optional[type[GitService]]:
+    """
+    Get the registered service class for the hostname, cleared on every
+    registration of a service.
+    """
+    service_kls = _SERVICE_HOSTNAMES.get(hostname)
+    if service_kls:
+        return service_kls
+
+    matched = _find_hostname(hostname, _SERVICE_HOSTNAMES)
+    return _SERVICE_HOSTNAMES[matched] if matched else None
+
+
+def use_for_service(service: str):
     """
     Class decorator that adds the class to the service mapping.
 
@@ -41,15 +65,14 @@ def use_for_service(service: str, _func=None):
         Decorator.
     """
 
-    def decorator_cover(func):
-        @functools.wraps(func)
-        def covered_func(kls: type[GitService]):
-            _SERVICE_MAPPING[service] = kls
-            return kls
-
-        return covered_func
+    def decorator(kls: type[GitService]) -> type[GitService]:
+        _SERVICE_MAPPING[service] = kls
+        # re-registering a hostname replaces the class, keeping its position
+        _SERVICE_HOSTNAMES[parse_git_repo(service).hostname] = kls
+        _get_registered_service_class.cache_clear()
+        return kls
 
-    return decorator_cover(_func)
+    return decorator
 
 
 def get_project(
@@ -82,24 +105,25 @@ def get_project(
     Returns:
         `GitProject` using the matching implementation.
     """
-    mapping = service_mapping_update.copy() if service_mapping_update else {}
-    custom_instances = custom_instances or []
-    for instance in custom_instances:
-        mapping[instance.hostname] = instance.__class__
+    mapping = service_mapping_update
+    custom_instances_by_hostname: dict[str, GitService] = {}
+    for instance in custom_instances or []:
+        # the first instance provided for the hostname is used
+        custom_instances_by_hostname.setdefault(instance.hostname, instance)
+    if custom_instances_by_hostname:
+        mapping = (service_mapping_update or {}) | {
+            hostname: instance.__class__
+            for hostname, instance in custom_instances_by_hostname.items()
+        }
 
     kls = get_service_class(url=url, service_mapping_update=mapping)
-    parsed_repo_url = parse_git_repo(url)
+    parsed_repo_url = parse_git_repo_cached(url)
 
     service = None
-    if custom_instances:
-        for service_inst in custom_instances:
-            if (
-                isinstance(service_inst, kls)
-                and service_inst.hostname == parsed_repo_url.hostname
-            ):
-                service = service_inst
-                break
-        else:
+    if custom_instances_by_hostname:
+        service = custom_instances_by_hostname.get(parsed_repo_url.hostname)
+        if not isinstance(service, kls):
+            service = None
             if force_custom_instance:
                 raise OgrException(
                     f"Instance of type {kls.__name__} "
@@ -127,17 +151,20 @@ def get_service_class_or_none(
     Returns:
         Matched class (subclass of `GitService`) or `None`.
     """
-    mapping = {}
-    mapping.update(_SERVICE_MAPPING)
-    if service_mapping_update:
-        mapping.update(service_mapping_update)
+    hostname = parse_git_repo_cached(url).hostname
+    if not service_mapping_update:
+        return _get_registered_service_class(hostname)
 
-    parsed_url = parse_git_repo(url)
-    for service, service_kls in mapping.items():
-        if parse_git_repo(service).hostname in parsed_url.hostname:
-            return service_kls
+    hostnames = _SERVICE_HOSTNAMES.copy()
+    for service, service_kls in service_mapping_update.items():
+        hostnames[parse_git_repo_cached(service).hostname] = service_kls
+
+    service_kls = hostnames.get(hostname)
+    if service_kls:
+        return service_kls
 
-    return None
+    matched = _find_hostname(hostname, hostnames)
+    return hostnames[matched] if matched else None
 
 
 def get_service_class(
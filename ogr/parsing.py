@@ -1,6 +1,7 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import functools
 from typing import Optional
 from urllib.parse import ParseResult, urlparse
 
@@ -20,6 +21,8 @@ class RepoUrl:
         scheme (Optional[str]): Protocol used to access repository.
     """
 
+    __slots__ = ("hostname", "is_fork", "namespace", "repo", "scheme", "username")
+
     def __init__(
         self,
         repo: str,
@@ -45,6 +48,8 @@ class RepoUrl:
         return f"{scheme}://{self.hostname}"
 
     def __eq__(self, o: object) -> bool:
+        if o is self:
+            return True
         if not isinstance(o, RepoUrl):
             return False
 
@@ -126,8 +131,7 @@ class RepoUrl:
         path = parsed.path.lstrip("/")
 
         # strip trailing '.git'
-        if path.endswith(".git"):
-            path = path[:-4]
+        path = path.removesuffix(".git")
 
         return path, path.split("/")
 
@@ -225,6 +229,23 @@ def parse_git_repo(potential_url: str) -> Optional[RepoUrl]:
     return RepoUrl.parse(potential_url)
 
 
+@functools.lru_cache(maxsize=1024)
+def parse_git_repo_cached(potential_url: str) -> Optional[RepoUrl]:
+    """
+    Cached variant of `parse_git_repo` for the repeated lookups of the same URLs.
+
+    The returned object is shared between the calls and must be treated as
+    read-only, use `parse_git_repo` to get an object that can be modified.
+
+    Args:
+        potential_url: URL of a git repository.
+
+    Returns:
+        Object of RepoUrl class if can be parsed, `None` otherwise.
+    """
+    return parse_git_repo(potential_url)
+
+
 def get_username_from_git_url(url: str) -> Optional[str]:
     """
     Returns username from the git URL.
@@ -267,5 +288,4 @@ def strip_dot_git(url: str) -> str:
     Returns:
         URL without trailing `.git`.
     """
-    """Strip trailing .git"""
-    return url[: -len(".git")] if url.endswith(".git") else url
+    return url.removesuffix(".git")
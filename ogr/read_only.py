@@ -18,6 +18,8 @@ from ogr.abstract import (
 )
 from ogr.constant import DEFAULT_RO_PREFIX_STRING
 
+logger = logging.getLogger(__name__)
+
 
 def log_output(
     text: str,
@@ -36,8 +38,8 @@ def log_output(
 
             Defaults to `__name__`.
     """
-    logger = logging.getLogger(namespace)
-    logger.warning(f"{default_prefix} {text}")
+    namespace_logger = logger if namespace == __name__ else logging.getLogger(namespace)
+    namespace_logger.warning("%s %s", default_prefix, text)
 
 
 def if_readonly(
@@ -69,20 +71,22 @@ def if_readonly(
     """
 
     def decorator_readonly(func):
+        func_name = func.__name__
+
         @functools.wraps(func)
         def readonly_func(self, *args, **kwargs):
             if not self.read_only:
                 return func(self, *args, **kwargs)
 
-            args_str = str(args)[1:-1]
-            kwargs_str = ", ".join(f"{k}={v!r}" for k, v in kwargs.items())
-            # add , in case there are also args, what has to be separated
-            if args and kwargs:
-                kwargs_str = ", " + kwargs_str
-            log_output(
-                f"{log_message} {self.__class__.__name__}."
-                f"{func.__name__}({args_str}{kwargs_str})",
-            )
+            # formatting of the arguments is not cheap, skip it if it's not logged
+            if logger.isEnabledFor(logging.WARNING):
+                arguments = ", ".join(
+                    [repr(arg) for arg in args]
+                    + [f"{k}={v!r}" for k, v in kwargs.items()],
+                )
+                log_output(
+                    f"{log_message} {type(self).__name__}.{func_name}({arguments})",
+                )
             if return_function:
                 return return_function(self, *args, **kwargs)
 
@@ -200,12 +204,13 @@ class GitProjectReadOnly:
     ) -> "PRComment":
         pull_request = original_object.get_pr(pr_id)
         log_output(pull_request)
+        now = datetime.datetime.now()
         return PRComment(
             parent=pull_request,
             body=body,
             author=cls.author,
-            created=datetime.datetime.now(),
-            edited=datetime.datetime.now(),
+            created=now,
+            edited=now,
         )
 
     @classmethod
@@ -229,12 +234,13 @@ class GitProjectReadOnly:
     ) -> "IssueComment":
         issue = original_object.get_issue(issue_id)
         log_output(issue)
+        now = datetime.datetime.now()
         return IssueComment(
             parent=issue,
             body=body,
             author=cls.author,
-            created=datetime.datetime.now(),
-            edited=datetime.datetime.now(),
+            created=now,
+            edited=now,
         )
 
     @classmethod
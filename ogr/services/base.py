@@ -1,8 +1,11 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from typing import Any, Optional
-from urllib.request import urlopen
+from functools import cached_property
+from typing import Optional
+
+import requests
+from urllib3.util import Retry
 
 from ogr.abstract import (
     CommitFlag,
@@ -16,38 +19,60 @@ from ogr.abstract import (
     Release,
 )
 from ogr.exceptions import OgrException
-from ogr.parsing import parse_git_repo
-from ogr.utils import filter_comments, search_in_comments
+from ogr.parsing import parse_git_repo, parse_git_repo_cached
+from ogr.utils import compile_regex, filter_comments, search_in_comments
 
-try:
-    from functools import cached_property
-except ImportError:
-    from functools import lru_cache
 
-    def cached_property(func):  # type: ignore
-        return property(lru_cache()(func))
+class BaseGitService(GitService):
+    @property
+    def _ssl_verify(self) -> bool:
+        """Whether the certificates are verified by the `http_session`."""
+        return True
 
+    @cached_property
+    def http_session(self) -> requests.Session:
+        """
+        Session for the plain HTTP requests done outside of the API clients,
+        keeps the connections alive between the requests and retries the
+        failed ones.
+        """
+        session = requests.Session()
+        session.verify = self._ssl_verify
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # return the last response, so that it is raised as HTTPError
+                raise_on_status=False,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
-class BaseGitService(GitService):
     @cached_property
     def hostname(self) -> Optional[str]:
         parsed_url = parse_git_repo(potential_url=self.instance_url)
         return parsed_url.hostname if parsed_url else None
 
     def get_project_from_url(self, url: str) -> "GitProject":
-        repo_url = parse_git_repo(potential_url=url)
+        # usually parsed already by the factory when looking up the service
+        repo_url = parse_git_repo_cached(url)
         if not repo_url:
             raise OgrException(f"Cannot parse project url: '{url}'")
         return self.get_project(repo=repo_url.repo, namespace=repo_url.namespace)
 
 
 class BaseGitProject(GitProject):
-    @property
+    @cached_property
     def full_repo_name(self) -> str:
         return f"{self.namespace}/{self.repo}"
 
 
-class BasePullRequest(PullRequest):
+class BasePullRequest(PullRequest, abstract=True):
     @property
     def target_branch_head_commit(self) -> str:
         return self.target_project.get_sha_from_branch(self.target_branch)
@@ -67,26 +92,31 @@ class BasePullRequest(PullRequest):
         reverse: bool = False,
         description: bool = True,
     ):
-        all_comments: list[Any] = self.get_comments(reverse=reverse)
-        if description:
-            description_content = self.description
-            if reverse:
-                all_comments.append(description_content)
-            else:
-                all_comments.insert(0, description_content)
-
-        return search_in_comments(comments=all_comments, filter_regex=filter_regex)
+        pattern = compile_regex(filter_regex)
+        if description and not reverse:
+            # description comes first, no need to fetch the comments if it matches
+            match = pattern.search(self.description)
+            if match:
+                return match
+
+        match = search_in_comments(
+            comments=self.get_comments(reverse=reverse),
+            filter_regex=pattern,
+        )
+        if not match and description and reverse:
+            # description comes last
+            match = pattern.search(self.description)
+        return match
 
     def get_statuses(self) -> list[CommitFlag]:
-        commit = self.get_all_commits()[-1]
-        return self.target_project.get_commit_statuses(commit)
+        return self.target_project.get_commit_statuses(self.head_commit)
 
 
 class BaseGitUser(GitUser):
     pass
 
 
-class BaseIssue(Issue):
+class BaseIssue(Issue, abstract=True):
     def get_comments(
         self,
         filter_regex: Optional[str] = None,
@@ -103,9 +133,10 @@ class BaseIssue(Issue):
 class BaseCommitFlag(CommitFlag):
     @classmethod
     def _state_from_str(cls, state: str) -> CommitStatus:
-        if state not in cls._states:
+        commit_status = cls._states.get(state)
+        if commit_status is None:
             raise ValueError("Invalid state given")
-        return cls._states[state]
+        return commit_status
 
     @classmethod
     def _validate_state(cls, state: CommitStatus) -> CommitStatus:
@@ -115,10 +146,13 @@ class BaseCommitFlag(CommitFlag):
         return state
 
 
-class BaseRelease(Release):
+class BaseRelease(Release, abstract=True):
     def save_archive(self, filename: str) -> None:
-        response = urlopen(self.tarball_url)
-        data = response.read()
-
-        with open(filename, "wb") as file:
-            file.write(data)
+        with self.project.service.http_session.get(
+            self.tarball_url,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            with open(filename, "wb") as file:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    file.write(chunk)
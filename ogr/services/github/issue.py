@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import datetime
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import github
 from github import UnknownObjectException
@@ -85,6 +85,38 @@ class GithubIssue(BaseIssue):
     def __str__(self) -> str:
         return "Github" + super().__str__()
 
+    def __getstate__(self) -> dict[str, Any]:
+        # PyGithub objects and the service of the project carry the requester
+        # with the session and credentials, keep only the payload and identity
+        # of the project, see GithubService.set_unpickling_service
+        state = self.__dict__.copy()
+        raw_issue = state.pop("_raw_issue")
+        project = state.pop("project")
+        # `raw_data` would fetch the issues from the paginated lists first
+        state["_raw_issue_data"] = (
+            raw_issue._rawData,
+            raw_issue._headers,
+            raw_issue.completed,
+        )
+        state["_project_data"] = (project.namespace, project.repo, project.read_only)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        raw_data, raw_headers, completed = state.pop("_raw_issue_data")
+        namespace, repo, read_only = state.pop("_project_data")
+        self.__dict__.update(state)
+        self.project = ogr_github.GithubService._resolve_unpickled_project(
+            namespace,
+            repo,
+            read_only,
+        )
+        self._raw_issue = _GithubIssue(
+            self.project.github_instance.requester,
+            raw_headers,
+            raw_data,
+            completed=completed,
+        )
+
     @staticmethod
     def create(
         project: "ogr_github.GithubProject",
@@ -168,8 +200,7 @@ class GithubIssue(BaseIssue):
         return self
 
     def add_label(self, *labels: str) -> None:
-        for label in labels:
-            self._raw_issue.add_to_labels(label)
+        self._raw_issue.add_to_labels(*labels)
 
     def add_assignee(self, *assignees: str) -> None:
         try:
@@ -94,6 +94,8 @@ class GithubProject(BaseGitProject):
                     self._github_repo.owner.login,
                     self._github_repo.name,
                 )
+                # drop the name cached with the old namespace/repo
+                self.__dict__.pop("full_repo_name", None)
         return self._github_repo
 
     def __str__(self) -> str:
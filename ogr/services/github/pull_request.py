@@ -3,7 +3,7 @@
 
 import datetime
 import logging
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import github
 import requests
@@ -131,6 +131,32 @@ class GithubPullRequest(BasePullRequest):
     def __str__(self) -> str:
         return "Github" + super().__str__()
 
+    def __getstate__(self) -> dict[str, Any]:
+        # see GithubIssue.__getstate__, the source project is fetched again
+        state = self.__dict__.copy()
+        raw_pr = state.pop("_raw_pr")
+        project = state.pop("_target_project")
+        state.pop("_source_project", None)
+        state["_raw_pr_data"] = (raw_pr._rawData, raw_pr._headers, raw_pr.completed)
+        state["_project_data"] = (project.namespace, project.repo, project.read_only)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        raw_data, raw_headers, completed = state.pop("_raw_pr_data")
+        namespace, repo, read_only = state.pop("_project_data")
+        self.__dict__.update(state)
+        self._target_project = ogr_github.GithubService._resolve_unpickled_project(
+            namespace,
+            repo,
+            read_only,
+        )
+        self._raw_pr = _GithubPullRequest(
+            self._target_project.github_instance.requester,
+            raw_headers,
+            raw_data,
+            completed=completed,
+        )
+
     @staticmethod
     def create(
         project: "ogr_github.GithubProject",
@@ -255,8 +281,7 @@ class GithubPullRequest(BasePullRequest):
         return self
 
     def add_label(self, *labels: str) -> None:
-        for label in labels:
-            self._raw_pr.add_to_labels(label)
+        self._raw_pr.add_to_labels(*labels)
 
     def get_comment(self, comment_id: int) -> PRComment:
         return GithubPRComment(self._raw_pr.get_issue_comment(comment_id))
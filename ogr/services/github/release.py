@@ -10,9 +10,10 @@ from github.GitRelease import GitRelease as PyGithubRelease
 from ogr.abstract import GitTag, Release
 from ogr.exceptions import GithubAPIException
 from ogr.services import github as ogr_github
+from ogr.services.base import BaseRelease
 
 
-class GithubRelease(Release):
+class GithubRelease(BaseRelease):
     _raw_release: PyGithubRelease
     project: "ogr_github.GithubProject"
 
@@ -3,7 +3,7 @@
 
 import logging
 import re
-from typing import Optional, Union
+from typing import ClassVar, Optional, Union
 
 import github
 import github.GithubObject
@@ -19,7 +19,7 @@ from github import (
 from urllib3.util import Retry
 
 from ogr.abstract import AuthMethod, GitUser
-from ogr.exceptions import GithubAPIException
+from ogr.exceptions import GithubAPIException, OgrException
 from ogr.factory import use_for_service
 from ogr.services.base import BaseGitService, GitProject
 from ogr.services.github.auth_providers import (
@@ -39,6 +39,9 @@ class GithubService(BaseGitService):
     # class parameter could be used to mock Github class api
     github_class: type[github.Github]
     instance_url = "https://github.com"
+    # service used for the projects of the unpickled issues and pull requests
+    _unpickling_service: ClassVar[Optional["GithubService"]] = None
+    _unpickled_projects: ClassVar[dict[tuple[str, str, bool], GithubProject]] = {}
 
     def __init__(
         self,
@@ -163,6 +166,46 @@ class GithubService(BaseGitService):
             **kwargs,
         )
 
+    @staticmethod
+    def set_unpickling_service(service: Optional["GithubService"]) -> None:
+        """
+        Set the service used to restore the projects of unpickled issues and
+        pull requests.
+
+        The credentials are not pickled with the issues and pull requests, the
+        process that unpickles them, e.g. a worker of `multiprocessing.Pool` in
+        its initializer, has to provide the service first.
+
+        Args:
+            service: Service to be used, `None` to unset it.
+        """
+        GithubService._unpickling_service = service
+        GithubService._unpickled_projects.clear()
+
+    @staticmethod
+    def _resolve_unpickled_project(
+        namespace: str,
+        repo: str,
+        read_only: bool,
+    ) -> "GithubProject":
+        service = GithubService._unpickling_service
+        if service is None:
+            raise OgrException(
+                "No service to restore the unpickled GitHub project with, "
+                "set it via GithubService.set_unpickling_service().",
+            )
+
+        # shared by the unpickled objects, so that the client is created only once
+        key = (namespace, repo, read_only)
+        if key not in GithubService._unpickled_projects:
+            GithubService._unpickled_projects[key] = GithubProject(
+                repo=repo,
+                namespace=namespace,
+                service=service,
+                read_only=read_only,
+            )
+        return GithubService._unpickled_projects[key]
+
     def get_project_from_github_repository(
         self,
         github_repo: PyGithubRepository.Repository,
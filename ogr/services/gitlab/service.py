@@ -43,6 +43,10 @@ class GitlabService(BaseGitService):
         if kwargs:
             logger.warning(f"Ignored keyword arguments: {kwargs}")
 
+    @property
+    def _ssl_verify(self) -> bool:
+        return self.ssl_verify
+
     @property
     def gitlab_instance(self) -> gitlab.Gitlab:
         if not self._gitlab_instance:
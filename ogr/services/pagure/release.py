@@ -7,9 +7,10 @@ from typing import Optional
 from ogr.abstract import GitTag, Release
 from ogr.exceptions import OperationNotSupported, PagureAPIException
 from ogr.services import pagure as ogr_pagure
+from ogr.services.base import BaseRelease
 
 
-class PagureRelease(Release):
+class PagureRelease(BaseRelease):
     _raw_release: GitTag
     project: "ogr_pagure.PagureProject"
 
@@ -86,3 +87,6 @@ class PagureRelease(Release):
 
     def edit_release(self, name: str, message: str) -> None:
         raise OperationNotSupported("edit_release not supported on Pagure")
+
+    def save_archive(self, filename: str) -> None:
+        raise OperationNotSupported("Pagure releases have no archive to download")
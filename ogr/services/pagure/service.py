@@ -62,6 +62,10 @@ class PagureService(BaseGitService):
         if kwargs:
             logger.warning(f"Ignored keyword arguments: {kwargs}")
 
+    @property
+    def _ssl_verify(self) -> bool:
+        return not self.insecure
+
     def __str__(self) -> str:
         token_str = (
             f", token='{self._token[:1]}***{self._token[-1:]}'" if self._token else ""
@@ -4,7 +4,7 @@
 import functools
 import logging
 import re
-from re import Match
+from re import Match, Pattern
 from typing import Any, Callable, Optional, Union
 
 from ogr.abstract import AnyComment, Comment
@@ -12,9 +12,33 @@ from ogr.abstract import AnyComment, Comment
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_cached(pattern: str) -> Pattern[str]:
+    """
+    Compile the regex, unlike the cache in `re` it is not shared with the rest
+    of the process, so the patterns used for filtering comments are not evicted
+    by unrelated ones.
+    """
+    return re.compile(pattern)
+
+
+def compile_regex(pattern: Union[str, Pattern[str]]) -> Pattern[str]:
+    """
+    Compile the regex used for searching and filtering comments.
+
+    Args:
+        pattern: Regex to be compiled, already compiled patterns are returned
+            as they are.
+
+    Returns:
+        Compiled pattern, string patterns are cached.
+    """
+    return pattern if isinstance(pattern, Pattern) else _compile_cached(pattern)
+
+
 def filter_comments(
     comments: list[AnyComment],
-    filter_regex: Optional[str] = None,
+    filter_regex: Optional[Union[str, Pattern[str]]] = None,
     reverse: bool = False,
     author: Optional[str] = None,
 ) -> list[AnyComment]:
@@ -24,7 +48,7 @@ def filter_comments(
     Args:
         comments: List of comments to be filtered.
         filter_regex: Regex to be used for filtering body of the
-            comments.
+            comments, can be already compiled.
 
             Defaults to `None`, which means no filtering by regex.
         reverse: Specifies ordering of the comments.
@@ -37,27 +61,21 @@ def filter_comments(
     Returns:
         List of comments that satisfy requested criteria.
     """
-    if reverse:
-        comments.reverse()
-
-    if filter_regex or author:
-        pattern = None
-        if filter_regex:
-            pattern = re.compile(filter_regex)
-
-        comments = list(
-            filter(
-                lambda comment: (not pattern or bool(pattern.search(comment.body)))
-                and (not author or comment.author == author),
-                comments,
-            ),
-        )
-    return comments
+    if not filter_regex and not author:
+        return comments[::-1] if reverse else comments
+
+    pattern = compile_regex(filter_regex) if filter_regex else None
+    return [
+        comment
+        for comment in (reversed(comments) if reverse else comments)
+        if (not author or comment.author == author)
+        and (not pattern or pattern.search(comment.body))
+    ]
 
 
 def search_in_comments(
     comments: list[Union[str, Comment]],
-    filter_regex: str,
+    filter_regex: Union[str, Pattern[str]],
 ) -> Optional[Match[str]]:
     """
     Find match in pull request description or comments.
@@ -65,12 +83,13 @@ def search_in_comments(
     Args:
         comments: List of comments or bodies of comments
             to be searched through.
-        filter_regex: Regex to be used for filtering with `re.search`.
+        filter_regex: Regex to be used for filtering with `re.search`, can be
+            already compiled.
 
     Returns:
         Match that has been found, `None` otherwise.
     """
-    pattern = re.compile(filter_regex)
+    pattern = compile_regex(filter_regex)
     for comment in comments:
         if isinstance(comment, Comment):
             comment = comment.body
@@ -179,7 +198,7 @@ def filter_paths(paths: list[str], filter_regex: str) -> list[str]:
     Returns:
         List of path that satisfy regex.
     """
-    pattern = re.compile(filter_regex)
+    pattern = compile_regex(filter_regex)
     return [path for path in paths if (not pattern or bool(pattern.search(path)))]
 
 
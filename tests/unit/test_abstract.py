@@ -0,0 +1,26 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from ogr.abstract import Issue, Release
+
+
+def test_missing_required_attributes():
+    with pytest.raises(TypeError) as ex:
+
+        class IncompleteRelease(Release):
+            @property
+            def title(self) -> str:
+                return "title"
+
+    assert "IncompleteRelease" in str(ex.value)
+    assert "title" not in str(ex.value)
+    assert "tarball_url" in str(ex.value)
+
+
+def test_abstract_subclass_skips_validation():
+    class IntermediateIssue(Issue, abstract=True):
+        pass
+
+    assert issubclass(IntermediateIssue, Issue)
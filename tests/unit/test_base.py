@@ -0,0 +1,72 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import pytest
+import requests
+from flexmock import flexmock
+
+from ogr import GithubService, GitlabService, PagureService
+from ogr.abstract import GitTag
+from ogr.exceptions import OperationNotSupported
+from ogr.services.github.release import GithubRelease
+from ogr.services.pagure.release import PagureRelease
+
+
+def release_with_response(response):
+    service = GithubService()
+    flexmock(service.http_session).should_receive("get").with_args(
+        "https://example.com/archive.tar.gz",
+        stream=True,
+    ).and_return(response).once()
+    return GithubRelease(
+        flexmock(tarball_url="https://example.com/archive.tar.gz"),
+        service.get_project(namespace="a", repo="b"),
+    )
+
+
+def test_save_archive(tmp_path):
+    response = flexmock(__enter__=None, __exit__=None)
+    response.should_receive("__enter__").and_return(response)
+    response.should_receive("raise_for_status").once()
+    response.should_receive("iter_content").with_args(
+        chunk_size=64 * 1024,
+    ).and_return(iter([b"first ", b"second"]))
+    archive = tmp_path / "archive.tar.gz"
+
+    release_with_response(response).save_archive(str(archive))
+
+    assert archive.read_bytes() == b"first second"
+
+
+def test_save_archive_http_error(tmp_path):
+    response = flexmock(__enter__=None, __exit__=None)
+    response.should_receive("__enter__").and_return(response)
+    response.should_receive("raise_for_status").and_raise(requests.HTTPError)
+    response.should_receive("iter_content").never()
+    archive = tmp_path / "archive.tar.gz"
+
+    with pytest.raises(requests.HTTPError):
+        release_with_response(response).save_archive(str(archive))
+
+    assert not archive.exists()
+
+
+def test_save_archive_pagure(tmp_path):
+    release = PagureRelease(GitTag("0.1.0", "abcd"), flexmock())
+
+    with pytest.raises(OperationNotSupported):
+        release.save_archive(str(tmp_path / "archive.tar.gz"))
+
+
+@pytest.mark.parametrize(
+    ("service", "verify"),
+    [
+        (GithubService(), True),
+        (GitlabService(), True),
+        (GitlabService(ssl_verify=False), False),
+        (PagureService(), True),
+        (PagureService(insecure=True), False),
+    ],
+)
+def test_http_session_verify(service, verify):
+    assert service.http_session.verify is verify
@@ -6,9 +6,14 @@ import pytest
 from flexmock import Mock, flexmock
 from urllib3.util import Retry
 
-from ogr import GithubService, GitlabService, PagureService
+from ogr import GithubService, GitlabService, PagureService, factory
 from ogr.exceptions import OgrException
-from ogr.factory import get_instances_from_dict, get_project, get_service_class
+from ogr.factory import (
+    get_instances_from_dict,
+    get_project,
+    get_service_class,
+    use_for_service,
+)
 from ogr.services.github import GithubProject
 from ogr.services.gitlab import GitlabProject
 from ogr.services.pagure import PagureProject
@@ -287,6 +292,15 @@ def test_get_project(url, mapping, instances, force_custom_instance, result):
     assert project == result
 
 
+def test_get_project_first_custom_instance_wins():
+    first = GithubService(token="aaaa")
+    project = get_project(
+        url="https://github.com/packit/ogr",
+        custom_instances=[first, GithubService(token="bbbb")],
+    )
+    assert project.service is first
+
+
 @pytest.mark.parametrize(
     ("url", "mapping", "instances", "exc_str"),
     [
@@ -530,3 +544,24 @@ def test_get_instances_from_dict_not_found(instances_in_dict, error_str):
     with pytest.raises(OgrException) as ex:
         _ = get_instances_from_dict(instances=instances_in_dict)
     assert error_str in str(ex.value)
+
+
+@pytest.fixture
+def restore_service_mapping():
+    mapping = factory._SERVICE_MAPPING.copy()
+    hostnames = factory._SERVICE_HOSTNAMES.copy()
+    yield
+    factory._SERVICE_MAPPING.clear()
+    factory._SERVICE_MAPPING.update(mapping)
+    factory._SERVICE_HOSTNAMES.clear()
+    factory._SERVICE_HOSTNAMES.update(hostnames)
+    factory._get_registered_service_class.cache_clear()
+
+
+def test_use_for_service_overrides_registered_hostname(restore_service_mapping):
+    @use_for_service("github.com")
+    class CustomGithubService(GithubService):
+        pass
+
+    assert get_service_class("https://github.com/packit/ogr") is CustomGithubService
+    assert list(factory._SERVICE_HOSTNAMES).index("github.com") == 0
@@ -1,21 +1,25 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import pickle
 from typing import Optional
 from unittest import TestCase
 
 import pytest
 from flexmock import flexmock
+from github.Issue import Issue as _GithubIssue
+from github.PullRequest import PullRequest as _GithubPullRequest
 
 from ogr import GithubService
 from ogr.abstract import AuthMethod
-from ogr.exceptions import GithubAPIException
+from ogr.exceptions import GithubAPIException, OgrException
 from ogr.services.github.auth_providers.token import TokenAuthentication
 from ogr.services.github.auth_providers.tokman import Tokman
 from ogr.services.github.check_run import (
     GithubCheckRunOutput,
     create_github_check_run_output,
 )
+from ogr.services.github.issue import GithubIssue
 from ogr.services.github.project import GithubProject
 from ogr.services.github.pull_request import GithubPullRequest
 
@@ -203,3 +207,127 @@ def test_no_set_reset_customized_auth_method(github_service_with_one_auth_method
     with pytest.raises(GithubAPIException):
         service.set_auth_method(AuthMethod.github_app)
     assert isinstance(service.authentication, Tokman)
+
+
+@pytest.fixture
+def unpickling_service():
+    service = GithubService(token="abcdef")
+    GithubService.set_unpickling_service(service)
+    yield service
+    GithubService.set_unpickling_service(None)
+
+
+def test_pickle_issue_without_requester(unpickling_service):
+    project = GithubService(token="abcdef").get_project(namespace="a", repo="b")
+    raw_issue = project.github_instance.create_from_raw_data(
+        _GithubIssue,
+        {
+            "number": 1,
+            "title": "Issue title",
+            "url": "https://api.github.com/repos/a/b/issues/1",
+        },
+    )
+    issue = GithubIssue(raw_issue, project)
+
+    pickled = pickle.dumps(issue)
+    assert b"Requester" not in pickled
+    assert b"abcdef" not in pickled
+
+    unpickled = pickle.loads(pickled)
+    assert unpickled.id == 1
+    assert unpickled.title == "Issue title"
+    assert isinstance(unpickled._raw_issue, _GithubIssue)
+    assert unpickled.project == project
+    assert unpickled.project.service is unpickling_service
+
+
+def test_pickle_pull_request_without_requester(unpickling_service):
+    project = GithubService(token="abcdef").get_project(namespace="a", repo="b")
+    raw_pr = project.github_instance.create_from_raw_data(
+        _GithubPullRequest,
+        {
+            "number": 2,
+            "title": "PR title",
+            "url": "https://api.github.com/repos/a/b/pulls/2",
+        },
+    )
+    pr = GithubPullRequest(raw_pr, project)
+
+    pickled = pickle.dumps(pr)
+    assert b"Requester" not in pickled
+    assert b"abcdef" not in pickled
+
+    unpickled = pickle.loads(pickled)
+    assert unpickled.id == 2
+    assert unpickled.title == "PR title"
+    assert isinstance(unpickled._raw_pr, _GithubPullRequest)
+    assert unpickled.target_project == project
+    assert unpickled.target_project.service is unpickling_service
+
+
+def test_pickle_incomplete_issue(unpickling_service):
+    project = GithubService(token="abcdef").get_project(namespace="a", repo="b")
+    raw_issue = _GithubIssue(
+        project.github_instance.requester,
+        {},
+        {
+            "number": 1,
+            "pull_request": None,
+            "url": "https://api.github.com/repos/a/b/issues/1",
+        },
+        completed=False,
+    )
+    flexmock(project.github_instance.requester).should_receive(
+        "requestJsonAndCheck",
+    ).never()
+
+    unpickled = pickle.loads(pickle.dumps(GithubIssue(raw_issue, project)))
+    assert unpickled.id == 1
+    assert not unpickled._raw_issue.completed
+    assert unpickled._raw_issue.url == "https://api.github.com/repos/a/b/issues/1"
+
+
+def test_unpickle_issue_without_service():
+    project = GithubService(token="abcdef").get_project(namespace="a", repo="b")
+    raw_issue = project.github_instance.create_from_raw_data(
+        _GithubIssue,
+        {"number": 1, "url": "https://api.github.com/repos/a/b/issues/1"},
+    )
+
+    pickled = pickle.dumps(GithubIssue(raw_issue, project))
+    with pytest.raises(OgrException):
+        pickle.loads(pickled)
+
+
+def test_full_repo_name_after_redirect():
+    project = GithubProject(repo="old_repo", service="test_service", namespace="old")
+    assert project.full_repo_name == "old/old_repo"
+
+    project._github_instance = flexmock()
+    project._github_instance.should_receive("get_repo").and_return(
+        flexmock(owner=flexmock(login="new"), name="new_repo"),
+    )
+
+    assert project.github_repo
+    assert project.full_repo_name == "new/new_repo"
+
+
+def test_pr_search_description_first():
+    pr = GithubPullRequest(flexmock(body="LGTM from the description"), None)
+    flexmock(pr).should_receive("get_comments").never()
+
+    match = pr.search(filter_regex="LGTM")
+    assert match.string == "LGTM from the description"
+
+
+def test_pr_search_description_last_in_reverse():
+    pr = GithubPullRequest(flexmock(body="LGTM from the description"), None)
+    flexmock(pr).should_receive("get_comments").with_args(reverse=True).and_return(
+        ["LGTM from a comment"],
+    ).and_return(["no match"])
+
+    assert pr.search(filter_regex="LGTM", reverse=True).string == "LGTM from a comment"
+    assert (
+        pr.search(filter_regex="LGTM", reverse=True).string
+        == "LGTM from the description"
+    )
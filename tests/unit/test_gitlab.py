@@ -13,3 +13,11 @@ class TestGitlabService(TestCase):
             GitlabService(instance_url="https://gitlab.gnome.org").hostname
             == "gitlab.gnome.org"
         )
+
+    def test_hash_after_attribute_change(self):
+        service = GitlabService(token="abcd")
+        assert hash(service) == hash(GitlabService(token="abcd"))
+
+        service.token = "wxyz"
+        assert service == GitlabService(token="wxyz")
+        assert service in {GitlabService(token="wxyz")}
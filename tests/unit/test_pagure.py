@@ -10,3 +10,19 @@ class TestPagureService(TestCase):
     def test_hostname(self):
         assert PagureService().hostname == "src.fedoraproject.org"
         assert PagureService(instance_url="https://pagure.io").hostname == "pagure.io"
+
+    def test_hash_after_change_token(self):
+        service = PagureService(token="abcd")
+        assert hash(service) == hash(PagureService(token="abcd"))
+
+        service.change_token("efgh")
+        assert hash(service) == hash(PagureService(token="efgh"))
+        assert service in {PagureService(token="efgh")}
+
+    def test_hash_after_attribute_change(self):
+        service = PagureService(token="abcd")
+        assert hash(service) == hash(PagureService(token="abcd"))
+
+        service.read_only = True
+        assert service == PagureService(token="abcd", read_only=True)
+        assert service in {PagureService(token="abcd", read_only=True)}
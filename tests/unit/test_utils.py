@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import datetime
+import re
 
 import pytest
 
@@ -79,3 +80,23 @@ def test_search_in_comments(comments, filter_str, starts_with, number_of_groups)
     else:
         assert len(match.regs) == number_of_groups
         assert match.string.startswith(starts_with)
+
+
+def test_search_in_comments_compiled_pattern(comments):
+    match = search_in_comments(comments=comments, filter_regex=re.compile(r"\d+"))
+    assert match.group() == "12345"
+
+
+def test_filter_comments_reverse(comments):
+    authors = [comment.author for comment in comments]
+
+    filtered = filter_comments(comments=comments, filter_regex="Just", reverse=True)
+    assert [comment.author for comment in filtered] == ["Mr. Brown", "Mr. Doe"]
+
+    # the given list is kept untouched
+    assert [comment.author for comment in comments] == authors
+
+
+def test_filter_comments_compiled_pattern(comments):
+    filtered = filter_comments(comments=comments, filter_regex=re.compile(r"\d+"))
+    assert [comment.author for comment in filtered] == ["Mr. Bean"]